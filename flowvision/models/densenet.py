@@ -1,6 +1,7 @@
 """
 Modified from https://github.com/pytorch/vision/blob/main/torchvision/models/densenet.py
 """
+import os
 from collections import OrderedDict
 from typing import Any, List, Tuple
 
@@ -8,6 +9,11 @@ import oneflow as flow
 import oneflow.nn as nn
 import oneflow.nn.functional as F
 
+try:
+    import oneflow.utils.checkpoint as cp
+except ImportError:
+    cp = None
+
 from .utils import load_state_dict_from_url
 from .registry import ModelCreator
 
@@ -23,11 +29,53 @@ model_urls = {
 }
 
 
+def _channel_axis() -> int:
+    # OneFlow builds Conv2d/BatchNorm2d/pooling layers in NHWC layout when
+    # ONEFLOW_ENABLE_NHWC=1 is set at construction time
+    return 3 if os.getenv("ONEFLOW_ENABLE_NHWC") == "1" else 1
+
+
+def _fuse_conv_bn(conv: nn.Conv2d, bn: nn.BatchNorm2d) -> nn.Conv2d:
+    # y = bn(conv(x)) is a per-output-channel affine map of conv(x), so it can be
+    # absorbed into the convolution weight and bias.
+    dtype = conv.weight.dtype
+    fused = nn.Conv2d(
+        conv.in_channels,
+        conv.out_channels,
+        kernel_size=conv.kernel_size,
+        stride=conv.stride,
+        padding=conv.padding,
+        dilation=conv.dilation,
+        groups=conv.groups,
+        bias=True,
+    ).to(device=conv.weight.device, dtype=dtype)
+    # fold in float32, so half precision models are not rounded twice, and cast
+    # the result back to the conv's own dtype
+    running_mean = bn.running_mean.float()
+    scale = bn.weight.float() / flow.sqrt(bn.running_var.float() + bn.eps)
+    bias = conv.bias.float() if conv.bias is not None else flow.zeros_like(running_mean)
+    weight = conv.weight.float() * scale.reshape(-1, 1, 1, 1)
+    bias = (bias - running_mean) * scale + bn.bias.float()
+    fused.weight.copy_(weight.to(dtype))
+    fused.bias.copy_(bias.to(dtype))
+    return fused
+
+
 class _DenseLayer(nn.Module):
     def __init__(
-        self, num_input_features: int, growth_rate: int, bn_size: int, drop_rate: float,
+        self,
+        num_input_features: int,
+        growth_rate: int,
+        bn_size: int,
+        drop_rate: float,
+        memory_efficient: bool = False,
     ) -> None:
         super(_DenseLayer, self).__init__()
+        if memory_efficient and cp is None:
+            raise RuntimeError(
+                "memory_efficient=True requires oneflow.utils.checkpoint, "
+                "which is not available in the installed OneFlow"
+            )
         self.norm1: nn.BatchNorm2d
         self.add_module("norm1", nn.BatchNorm2d(num_input_features))
         self.relu1: nn.ReLU
@@ -60,34 +108,37 @@ class _DenseLayer(nn.Module):
             ),
         )
         self.drop_rate = float(drop_rate)
+        self.memory_efficient = memory_efficient
+        self.channel_axis = _channel_axis()
 
     def bn_function(self, inputs: List[flow.Tensor]) -> flow.Tensor:
-        concated_features = flow.cat(inputs, 1)
+        if len(inputs) == 1:
+            # a single input is already the concatenated feature map, e.g. a
+            # channel slice of the shared buffer in `_DenseBlock`
+            concated_features = inputs[0]
+        else:
+            concated_features = flow.cat(inputs, self.channel_axis)
         bottleneck_output = self.conv1(
             self.relu1(self.norm1(concated_features))
         )  # noqa: T484
         return bottleneck_output
 
-    # todo: rewrite when torchscript supports any
-    def any_requires_grad(self, input: List[flow.Tensor]) -> bool:
-        for tensor in input:
-            if tensor.requires_grad:
-                return True
-        return False
-
-    def forward(self, input: List[flow.Tensor]) -> flow.Tensor:
-        pass
+    def call_checkpoint_bottleneck(self, input: List[flow.Tensor]) -> flow.Tensor:
+        def closure(*inputs):
+            return self.bn_function(inputs)
 
-    def forward(self, input: flow.Tensor) -> flow.Tensor:
-        pass
+        # concat + norm1 + relu1 + conv1 are recomputed during backward instead of
+        # keeping the O(L^2) concatenated activations alive. There is no dropout
+        # inside the closure, so the RNG state does not need to be preserved.
+        return cp.checkpoint(closure, *input, preserve_rng_state=False)
 
-    def forward(self, input) -> flow.Tensor:  # noqa: F811
-        if isinstance(input, flow.Tensor):
-            prev_features = [input]
+    def forward(self, prev_features: List[flow.Tensor]) -> flow.Tensor:
+        # checkpointing only pays off when a backward pass follows; checking the
+        # mode flags is O(1) instead of scanning every input's requires_grad
+        if self.memory_efficient and self.training and flow.is_grad_enabled():
+            bottleneck_output = self.call_checkpoint_bottleneck(prev_features)
         else:
-            prev_features = input
-
-        bottleneck_output = self.bn_function(prev_features)
+            bottleneck_output = self.bn_function(prev_features)
 
         new_features = self.conv2(self.relu2(self.norm2(bottleneck_output)))
         if self.drop_rate > 0:
@@ -96,6 +147,12 @@ class _DenseLayer(nn.Module):
             )
         return new_features
 
+    def fuse_for_inference(self) -> None:
+        if isinstance(self.norm2, nn.Identity):
+            return
+        self.conv1 = _fuse_conv_bn(self.conv1, self.norm2)
+        self.norm2 = nn.Identity()
+
 
 class _DenseBlock(nn.ModuleDict):
     _version = 2
@@ -107,23 +164,50 @@ class _DenseBlock(nn.ModuleDict):
         bn_size: int,
         growth_rate: int,
         drop_rate: float,
+        memory_efficient: bool = False,
     ) -> None:
         super(_DenseBlock, self).__init__()
+        self.num_layers = num_layers
+        self.num_input_features = num_input_features
+        self.growth_rate = growth_rate
+        self.channel_axis = _channel_axis()
         for i in range(num_layers):
             layer = _DenseLayer(
                 num_input_features + i * growth_rate,
                 growth_rate=growth_rate,
                 bn_size=bn_size,
                 drop_rate=drop_rate,
+                memory_efficient=memory_efficient,
             )
             self.add_module("denselayer%d" % (i + 1), layer)
 
     def forward(self, init_features):
+        if not flow.is_grad_enabled():
+            return self._forward_shared(init_features)
+
         features = [init_features]
-        for name, layer in self.items():
+        for layer in self.values():
             new_features = layer(features)
             features.append(new_features)
-        return flow.cat(features, dim=1)
+        return flow.cat(features, dim=self.channel_axis)
+
+    def _forward_shared(self, init_features):
+        # Without autograd, every layer reads its input as a channel slice of one
+        # preallocated buffer and writes its output into the next free slot, so
+        # the growing feature list is never re-concatenated.
+        shape = list(init_features.shape)
+        shape[self.channel_axis] += self.num_layers * self.growth_rate
+        buf = flow.empty(*shape, dtype=init_features.dtype, device=init_features.device)
+        buf[self._channels(0, self.num_input_features)] = init_features
+        c_used = self.num_input_features
+        for layer in self.values():
+            new_features = layer([buf[self._channels(0, c_used)]])
+            buf[self._channels(c_used, c_used + self.growth_rate)] = new_features
+            c_used += self.growth_rate
+        return buf
+
+    def _channels(self, start: int, end: int) -> Tuple[slice, ...]:
+        return (slice(None),) * self.channel_axis + (slice(start, end),)
 
 
 class _Transition(nn.Sequential):
@@ -142,6 +226,21 @@ class _Transition(nn.Sequential):
             ),
         )
         self.add_module("pool", nn.AvgPool2d(kernel_size=2, stride=2))
+        self.channel_axis = _channel_axis()
+
+    def fuse_for_inference(self) -> None:
+        if isinstance(self.pool, nn.Identity):
+            return
+        # a 1x1 conv followed by a 2x2 stride-2 average pool is one 2x2 stride-2
+        # conv whose kernel repeats the 1x1 weights over the window, scaled by 1/4
+        conv = self.conv
+        fused = nn.Conv2d(
+            conv.in_channels, conv.out_channels, kernel_size=2, stride=2, bias=False
+        ).to(device=conv.weight.device, dtype=conv.weight.dtype)
+        repeats = (1, 1, 2, 2) if self.channel_axis == 1 else (1, 2, 2, 1)
+        fused.weight.copy_(conv.weight.repeat(*repeats) * 0.25)
+        self.conv = fused
+        self.pool = nn.Identity()
 
 
 class DenseNet(nn.Module):
@@ -155,6 +254,16 @@ class DenseNet(nn.Module):
           (i.e. bn_size * k features in the bottleneck layer)
         drop_rate (float): Dropout rate after each dense layer
         num_classes (int): Number of classification classes
+        memory_efficient (bool): If True, uses checkpointing. Much more memory efficient,
+          but slower. Default: ``False``
+        use_amp (bool): If True, runs the feature extractor under ``flow.autocast`` in
+          bfloat16 while the classifier head stays in float32. Default: ``False``
+
+    .. note::
+        When the model is built with ``ONEFLOW_ENABLE_NHWC=1`` set, all layers use the
+        channels-last (NHWC) layout, which lets cuDNN pick its faster NHWC / Tensor Core
+        convolution kernels. The model still takes NCHW inputs and permutes them once
+        on entry.
     """
 
     def __init__(
@@ -165,31 +274,38 @@ class DenseNet(nn.Module):
         bn_size: int = 4,
         drop_rate: float = 0,
         num_classes: int = 1000,
+        memory_efficient: bool = False,
+        use_amp: bool = False,
     ) -> None:
 
         super(DenseNet, self).__init__()
+        if use_amp and not hasattr(flow, "autocast"):
+            raise RuntimeError(
+                "use_amp=True requires flow.autocast, which is not available in "
+                "the installed OneFlow"
+            )
+        self.use_amp = use_amp
+        self.channel_last = _channel_axis() == 3
+        # set by `fuse_for_inference` once norm5 also applies the head ReLU
+        self.norm5_relu_fused = False
 
         # First convolution
-        self.features = nn.Sequential(
-            OrderedDict(
-                [
-                    (
-                        "conv0",
-                        nn.Conv2d(
-                            3,
-                            num_init_features,
-                            kernel_size=7,
-                            stride=2,
-                            padding=3,
-                            bias=False,
-                        ),
-                    ),
-                    ("norm0", nn.BatchNorm2d(num_init_features)),
-                    ("relu0", nn.ReLU(inplace=True)),
-                    ("pool0", nn.MaxPool2d(kernel_size=3, stride=2, padding=1)),
-                ]
-            )
-        )
+        layers = [
+            (
+                "conv0",
+                nn.Conv2d(
+                    3,
+                    num_init_features,
+                    kernel_size=7,
+                    stride=2,
+                    padding=3,
+                    bias=False,
+                ),
+            ),
+            ("norm0", nn.BatchNorm2d(num_init_features)),
+            ("relu0", nn.ReLU(inplace=True)),
+            ("pool0", nn.MaxPool2d(kernel_size=3, stride=2, padding=1)),
+        ]
 
         # Each denseblock
         num_features = num_init_features
@@ -200,19 +316,21 @@ class DenseNet(nn.Module):
                 bn_size=bn_size,
                 growth_rate=growth_rate,
                 drop_rate=drop_rate,
+                memory_efficient=memory_efficient,
             )
-            self.features.add_module("denseblock%d" % (i + 1), block)
+            layers.append(("denseblock%d" % (i + 1), block))
             num_features = num_features + num_layers * growth_rate
             if i != len(block_config) - 1:
                 trans = _Transition(
                     num_input_features=num_features,
                     num_output_features=num_features // 2,
                 )
-                self.features.add_module("transition%d" % (i + 1), trans)
+                layers.append(("transition%d" % (i + 1), trans))
                 num_features = num_features // 2
 
         # Final batch norm
-        self.features.add_module("norm5", nn.BatchNorm2d(num_features))
+        layers.append(("norm5", nn.BatchNorm2d(num_features)))
+        self.features = nn.Sequential(OrderedDict(layers))
 
         # Linear layer
         self.classifier = nn.Linear(num_features, num_classes)
@@ -228,13 +346,80 @@ class DenseNet(nn.Module):
                 nn.init.constant_(m.bias, 0)
 
     def forward(self, x: flow.Tensor) -> flow.Tensor:
-        features = self.features(x)
-        out = F.relu(features, inplace=True)
-        out = F.adaptive_avg_pool2d(out, (1, 1))
-        out = flow.flatten(out, 1)
+        if self.channel_last:
+            x = x.permute(0, 2, 3, 1)
+        if self.use_amp:
+            with flow.autocast(device_type=x.device.type, dtype=flow.bfloat16):
+                features = self.features(x)
+            features = features.float()
+        else:
+            features = self.features(x)
+        if not self.norm5_relu_fused:
+            features = F.relu(features, inplace=True)
+        # global average pooling as a single reduction straight to (N, C)
+        spatial_dims = [1, 2] if self.channel_last else [2, 3]
+        out = features.mean(dim=spatial_dims)
         out = self.classifier(out)
         return out
 
+    @flow.no_grad()
+    def fuse_for_inference(self) -> "DenseNet":
+        """
+        Switches the model to eval mode and rewrites it for inference: every
+        BatchNorm that directly follows a convolution is folded into that
+        convolution, the stem ReLU is moved after the max pool so it runs on
+        the 4x smaller pooled map, and each transition's 1x1 conv and 2x2
+        average pool are merged into a single 2x2 stride-2 conv. On CUDA, the
+        final norm5 and the head ReLU are also merged into one fused
+        BatchNorm-ReLU kernel. The fused model gives the same outputs in eval
+        mode but is no longer suitable for training, and its state dict no
+        longer matches the pretrained checkpoints. Calling it again is a no-op.
+
+        For example:
+
+        .. code-block:: python
+
+            >>> import flowvision
+            >>> model = flowvision.models.densenet121(pretrained=True).fuse_for_inference()
+
+        """
+        self._fuse_stem()
+        for m in list(self.modules()):
+            if isinstance(m, (_DenseLayer, _Transition)):
+                m.fuse_for_inference()
+        self._fuse_norm5_relu()
+        # switch to eval last: the modules rebuilt above start in training mode
+        self.eval()
+        return self
+
+    def _fuse_stem(self) -> None:
+        features = self.features
+        if isinstance(features.norm0, nn.Identity):
+            return
+        features.conv0 = _fuse_conv_bn(features.conv0, features.norm0)
+        features.norm0 = nn.Identity()
+        # max pooling commutes with ReLU, so relu0 can run on the pooled map
+        children = OrderedDict(features.named_children())
+        names = list(children)
+        i = names.index("relu0")
+        names[i], names[i + 1] = names[i + 1], names[i]
+        self.features = nn.Sequential(OrderedDict((n, children[n]) for n in names))
+
+    def _fuse_norm5_relu(self) -> None:
+        norm5 = self.features.norm5
+        # nn.FusedBatchNorm2d only has a CUDA kernel
+        if self.norm5_relu_fused or norm5.weight.device.type != "cuda":
+            return
+        fused = nn.FusedBatchNorm2d(
+            norm5.num_features, eps=norm5.eps, momentum=norm5.momentum
+        ).to(device=norm5.weight.device, dtype=norm5.weight.dtype)
+        fused.weight.copy_(norm5.weight)
+        fused.bias.copy_(norm5.bias)
+        fused.running_mean.copy_(norm5.running_mean)
+        fused.running_var.copy_(norm5.running_var)
+        self.features.norm5 = fused
+        self.norm5_relu_fused = True
+
 
 def _load_pretrained(
     model_name: str,
@@ -248,11 +433,17 @@ def _load_pretrained(
             "No checkpoint is available for model type {}".format(model_name)
         )
     checkpoint_url = model_urls[model_name]
-    model.load_state_dict(
-        load_state_dict_from_url(
-            checkpoint_url, model_dir, progress=progress, check_hash=check_hash
-        )
+    state_dict = load_state_dict_from_url(
+        checkpoint_url, model_dir, progress=progress, check_hash=check_hash
     )
+    if getattr(model, "channel_last", False):
+        # checkpoints store conv weights as (out, in, kh, kw), NHWC convs expect
+        # (out, kh, kw, in)
+        state_dict = {
+            k: v.permute(0, 2, 3, 1) if v.ndim == 4 else v
+            for k, v in state_dict.items()
+        }
+    model.load_state_dict(state_dict)
 
 
 def _densenet(
@@ -1,5 +1,6 @@
 """
 """
+import functools
 import warnings
 import numbers
 from enum import Enum
@@ -30,35 +31,56 @@ class InterpolationMode(Enum):
     r"""Interpolation modes
     """
 
-    NEAREST = "nearest"
-    BILINEAR = "bilinear"
-    BICUBIC = "bicubic"
+    def __new__(cls, value, pil_value):
+        # the value stays the mode string, the PIL constant rides along on the member
+        member = object.__new__(cls)
+        member._value_ = value
+        member.pil_value = pil_value
+        return member
+
+    NEAREST = ("nearest", 0)
+    BILINEAR = ("bilinear", 2)
+    BICUBIC = ("bicubic", 3)
     # For PIL compatibility
-    BOX = "box"
-    HAMMING = "hamming"
-    LANCZOS = "lanczos"
+    BOX = ("box", 4)
+    HAMMING = ("hamming", 5)
+    LANCZOS = ("lanczos", 1)
+
+
+# indexed by the PIL integer constant of each mode
+_int_to_interpolation_mode = (
+    InterpolationMode.NEAREST,
+    InterpolationMode.LANCZOS,
+    InterpolationMode.BILINEAR,
+    InterpolationMode.BICUBIC,
+    InterpolationMode.BOX,
+    InterpolationMode.HAMMING,
+)
 
 
 def _interpolation_modes_from_int(i: int) -> InterpolationMode:
-    inverse_modes_mapping = {
-        0: InterpolationMode.NEAREST,
-        2: InterpolationMode.BILINEAR,
-        3: InterpolationMode.BICUBIC,
-        4: InterpolationMode.BOX,
-        5: InterpolationMode.HAMMING,
-        1: InterpolationMode.LANCZOS,
-    }
-    return inverse_modes_mapping[i]
+    # reject negative ints too, the tuple would silently index from the end
+    if not 0 <= i < len(_int_to_interpolation_mode):
+        raise KeyError(i)
+    return _int_to_interpolation_mode[i]
 
 
-pil_modes_mapping = {
-    InterpolationMode.NEAREST: 0,
-    InterpolationMode.BILINEAR: 2,
-    InterpolationMode.BICUBIC: 3,
-    InterpolationMode.BOX: 4,
-    InterpolationMode.HAMMING: 5,
-    InterpolationMode.LANCZOS: 1,
-}
+def _check_interpolation(interpolation) -> InterpolationMode:
+    # Backward compatibility with integer value
+    if isinstance(interpolation, int):
+        warnings.warn(
+            "Argument interpolation should be of type InterpolationMode instead of int. "
+            "Please, use InterpolationMode enum."
+        )
+        interpolation = _interpolation_modes_from_int(interpolation)
+
+    if not isinstance(interpolation, InterpolationMode):
+        raise TypeError("Argument interpolation should be a InterpolationMode")
+    return interpolation
+
+
+# kept for backward compatibility, prefer ``InterpolationMode.pil_value``
+pil_modes_mapping = {mode: mode.pil_value for mode in InterpolationMode}
 
 
 _pil_interpolation_to_str = {
@@ -87,15 +109,13 @@ else:
     _flow_interpolation_to_str = {}
 
 
-def str_to_pil_interp(mode_str):
-    return _str_to_pil_interpolation[mode_str]
-
+# plain dict lookups, bound once at import
+str_to_pil_interp = _str_to_pil_interpolation.__getitem__
 
-def str_to_interp_mode(mode_str):
-    if has_interpolation_mode:
-        return _str_to_flow_interpolation[mode_str]
-    else:
-        return _str_to_pil_interpolation[mode_str]
+if has_interpolation_mode:
+    str_to_interp_mode = _str_to_flow_interpolation.__getitem__
+else:
+    str_to_interp_mode = _str_to_pil_interpolation.__getitem__
 
 
 def _get_image_size(img: Tensor) -> List[int]:
@@ -131,6 +151,19 @@ def _is_numpy_image(img: Any) -> bool:
     return img.ndim in {2, 3}
 
 
+_pil_mode_to_nptype = {"I": np.int32, "I;16": np.int16, "F": np.float32}
+
+# PIL mode -> (numpy dtype to read the image as, scale of the float conversion).
+# Mode "1" is read straight as 0/1 floats, which already are the scaled result.
+_uint8_to_tensor = (np.uint8, 1.0 / 255.0)
+_pil_mode_to_tensor_dispatch = {
+    "1": (np.float32, None),
+    "I": (np.int32, None),
+    "I;16": (np.int16, None),
+    "F": (np.float32, None),
+}
+
+
 def to_tensor(pic):
     """Convert a ``PIL Image`` or ``numpy.ndarray`` to tensor.
     See :class:`~transforms.ToTensor` for more details.
@@ -147,41 +180,42 @@ def to_tensor(pic):
             "pic should be 2/3 dimensional. Got {} dimensions.".format(pic.ndim)
         )
 
-    # default_float_dtype = flow.get_default_dtype()
-    default_float_dtype = flow.float32
-
     if isinstance(pic, np.ndarray):
         # handle numpy array
         if pic.ndim == 2:
             pic = pic[:, :, None]
 
-        img = flow.tensor(np.ascontiguousarray(pic.transpose((2, 0, 1))))
         # backward compatibility
-        if img.dtype == flow.uint8:
-            return flow._C.cast(img, dtype=default_float_dtype).div(255)
-        else:
-            return img
+        if pic.dtype == np.uint8:
+            # transpose and cast in one numpy copy, then scale in place
+            np_arr = pic.transpose((2, 0, 1)).astype(np.float32, order="C")
+            np.multiply(np_arr, 1.0 / 255.0, out=np_arr)
+            return flow.from_numpy(np_arr)
+        # always copy (C order) so the tensor never aliases the caller's array;
+        # a single channel CHW view is already contiguous and would be shared
+        return flow.from_numpy(pic.transpose((2, 0, 1)).copy())
 
     if accimage is not None and isinstance(pic, accimage.Image):
-        nppic = np.zeros([pic.channels, pic.height, pic.width], dtype=np.float32)
+        # copyto fills every element, and the tensor takes over the buffer
+        nppic = np.empty([pic.channels, pic.height, pic.width], dtype=np.float32)
         pic.copyto(nppic)
-        return flow.tensor(nppic, dtype=default_float_dtype)
+        return flow.from_numpy(nppic)
 
     # handle PIL Image
-    mode_to_nptype = {"I": np.int32, "I;16": np.int16, "F": np.float32}
-
-    np_arr = np.array(pic, mode_to_nptype.get(pic.mode, np.uint8), copy=True)
-    img = flow.from_numpy(np_arr)
+    nptype, scale = _pil_mode_to_tensor_dispatch.get(pic.mode, _uint8_to_tensor)
+    # no copy up front, the branches below only copy where they have to
+    np_arr = np.asarray(pic, dtype=nptype)
 
-    if pic.mode == "1":
-        img = 255 * img
-
-    img = flow._C.reshape(img, shape=(pic.size[1], pic.size[0], len(pic.getbands())))
+    np_arr = np_arr.reshape(pic.size[1], pic.size[0], len(pic.getbands()))
     # put it from HWC to CHW format
-    res = flow._C.transpose(img, perm=[2, 0, 1])
-    if img.dtype == flow.uint8:
-        res = flow._C.cast(res, dtype=default_float_dtype).div(255)
-    return res
+    if scale is not None:
+        np_arr = np_arr.transpose((2, 0, 1)).astype(np.float32, order="C")
+        np.multiply(np_arr, scale, out=np_arr)
+        return flow.from_numpy(np_arr)
+    if not np_arr.flags.writeable:
+        # single channel images would otherwise share PIL's read-only buffer
+        np_arr = np_arr.copy()
+    return flow.from_numpy(np_arr).permute((2, 0, 1)).contiguous()
 
 
 def pil_to_tensor(pic):
@@ -200,15 +234,16 @@ def pil_to_tensor(pic):
 
     if accimage is not None and isinstance(pic, accimage.Image):
         # accimage format is always uint8 internally, so always return uint8 here
-        nppic = np.zeros([pic.channels, pic.height, pic.width], dtype=np.uint8)
+        nppic = np.empty([pic.channels, pic.height, pic.width], dtype=np.uint8)
         pic.copyto(nppic)
-        return flow.tensor(nppic)
+        return flow.from_numpy(nppic)
 
     # handle PIL Image
-    img = flow.tensor(np.asarray(pic))
-    img = img.view(pic.size[1], pic.size[0], len(pic.getbands()))
-    # put it from HWC to CHW format
-    return img.permute((2, 0, 1))
+    np_arr = np.asarray(pic, dtype=_pil_mode_to_nptype.get(pic.mode))
+    np_arr = np_arr.reshape(pic.size[1], pic.size[0], len(pic.getbands()))
+    # put it from HWC to CHW format, the only copy, and the tensor shares it
+    np_arr = np.array(np_arr.transpose((2, 0, 1)), order="C")
+    return flow.from_numpy(np_arr)
 
 
 def convert_image_dtype(
@@ -254,6 +289,12 @@ def to_pil_image(pic, mode=None):
 
     Returns:
         PIL Image: Image converted to PIL Image.
+
+    .. note::
+        No copy is made when ``pic`` is already a contiguous HWC buffer of the target
+        type, so for modes such as ``"L"``, ``"F"`` or ``"RGBA"`` the returned image
+        may share memory with ``pic``. Modifying ``pic`` in place afterwards can
+        change the image.
     """
     if not (isinstance(pic, flow.Tensor) or isinstance(pic, np.ndarray)):
         raise TypeError("pic should be Tensor or ndarray. Got {}".format(type(pic)))
@@ -299,8 +340,9 @@ def to_pil_image(pic, mode=None):
     npimg = pic
     if isinstance(pic, flow.Tensor):
         if pic.is_floating_point() and mode != "F":
-            pic = pic.mul(255).to(flow.uint8)
-        npimg = np.transpose(pic.cpu().numpy(), (1, 2, 0))
+            pic = pic.mul(255).clamp(0, 255).to(flow.uint8)
+        # permute on the tensor so numpy() is called once on an HWC buffer
+        npimg = pic.permute((1, 2, 0)).contiguous().cpu().numpy()
 
     if not isinstance(npimg, np.ndarray):
         raise TypeError(
@@ -367,6 +409,29 @@ def to_pil_image(pic, mode=None):
     return Image.fromarray(npimg, mode=mode)
 
 
+@functools.lru_cache(maxsize=128)
+def _get_normalize_tensors(mean, std, dtype, device):
+    # NOTE: cached tensors are shared between calls and must not be modified in place
+    # mean and std are (shape, flat values) pairs, see `normalize`
+    mean = np.reshape(mean[1], mean[0]).tolist()
+    std = np.reshape(std[1], std[0]).tolist()
+    mean = flow.as_tensor(mean, dtype=dtype, device=device)
+    std = flow.as_tensor(std, dtype=dtype, device=device)
+    if mean.ndim == 1:
+        mean = flow._C.reshape(mean, shape=(-1, 1, 1))
+    if std.ndim == 1:
+        std = flow._C.reshape(std, shape=(-1, 1, 1))
+    inv_std = 1.0 / std
+    return inv_std, -mean * inv_std
+
+
+@functools.lru_cache(maxsize=128)
+def _get_pil_normalize_arrays(mean, std):
+    mean = np.asarray(mean, dtype=np.float32)
+    std = np.asarray(std, dtype=np.float32)
+    return 1.0 / (std * 255.0), -mean / std
+
+
 def normalize(
     tensor: Tensor, mean: List[float], std: List[float], inplace: bool = False
 ) -> Tensor:
@@ -384,10 +449,17 @@ def normalize(
         Tensor: Normalized Tensor image.
     """
     if isinstance(tensor, Image.Image):
-        tensor = tensor.convert("RGB")
-        im = np.array(tensor).astype(np.float32)
-        im = im / 255.0
-        im = (im - mean) / std
+        scale, shift = _get_pil_normalize_arrays(
+            tuple(np.asarray(mean, dtype=np.float32).ravel().tolist()),
+            tuple(np.asarray(std, dtype=np.float32).ravel().tolist()),
+        )
+        # convert() copies even when the mode already matches
+        if tensor.mode != "RGB":
+            tensor = tensor.convert("RGB")
+        # (x / 255 - mean) / std as one in-place multiply and add
+        im = np.asarray(tensor, dtype=np.float32)
+        im *= scale
+        im += shift
         return im
 
     if not isinstance(tensor, flow.Tensor):
@@ -406,27 +478,30 @@ def normalize(
             "{}.".format(tensor.size())
         )
 
-    if not inplace:
-        tensor = tensor.clone()
-
     dtype = tensor.dtype
     # NOTE: np array cannot be used as flow.as_tensor argument because of oneflow bug
     np_dtype = flow.framework.dtype.convert_oneflow_dtype_to_numpy_dtype(dtype)
-    if (np.array(std, dtype=np_dtype) == 0).any():
+    mean = np.asarray(mean, dtype=np_dtype)
+    std = np.asarray(std, dtype=np_dtype)
+    if (std == 0).any():
         raise ValueError(
             "std evaluated to zero after conversion to {}, leading to division by zero.".format(
                 dtype
             )
         )
 
-    mean = flow.as_tensor(mean, dtype=dtype, device=tensor.device)
-    std = flow.as_tensor(std, dtype=dtype, device=tensor.device)
-    if mean.ndim == 1:
-        mean = flow._C.reshape(mean, shape=(-1, 1, 1))
-    if std.ndim == 1:
-        std = flow._C.reshape(std, shape=(-1, 1, 1))
-    tensor.sub_(mean).div_(std)
-    return tensor
+    # scalars, sequences and tensors with the same values share one cache entry
+    inv_std, shift = _get_normalize_tensors(
+        (mean.shape, tuple(mean.ravel().tolist())),
+        (std.shape, tuple(std.ravel().tolist())),
+        dtype,
+        str(tensor.device),
+    )
+    # (x - mean) / std == x * (1 / std) + (-mean / std)
+    if not inplace:
+        # a single kernel writing a new tensor, no clone needed
+        return flow.addcmul(shift, tensor, inv_std)
+    return tensor.mul_(inv_std).add_(shift)
 
 
 def resize(
@@ -454,19 +529,10 @@ def resize(
     Returns:
         PIL Image or Tensor: Resized image.
     """
-    # Backward compatibility with integer value
-    if isinstance(interpolation, int):
-        warnings.warn(
-            "Argument interpolation should be of type InterpolationMode instead of int. "
-            "Please, use InterpolationMode enum."
-        )
-        interpolation = _interpolation_modes_from_int(interpolation)
-
-    if not isinstance(interpolation, InterpolationMode):
-        raise TypeError("Argument interpolation should be a InterpolationMode")
+    interpolation = _check_interpolation(interpolation)
 
     if not isinstance(img, (flow.Tensor, flow._oneflow_internal.Tensor)):
-        pil_interpolation = pil_modes_mapping[interpolation]
+        pil_interpolation = interpolation.pil_value
         return F_pil.resize(img, size=size, interpolation=pil_interpolation)
 
     return F_t.resize(img, size=size, interpolation=interpolation.value)
@@ -571,20 +637,16 @@ def center_crop(img: Tensor, output_size: List[int]) -> Tensor:
     image_width, image_height = _get_image_size(img)
     crop_height, crop_width = output_size
 
-    if crop_width > image_width or crop_height > image_height:
-        padding_ltrb = [
-            (crop_width - image_width) // 2 if crop_width > image_width else 0,
-            (crop_height - image_height) // 2 if crop_height > image_height else 0,
-            (crop_width - image_width + 1) // 2 if crop_width > image_width else 0,
-            (crop_height - image_height + 1) // 2 if crop_height > image_height else 0,
-        ]
-        img = pad(img, padding_ltrb, fill=0)  # PIL uses fill value 0
-        image_width, image_height = _get_image_size(img)
-        if crop_width == image_width and crop_height == image_height:
-            return img
-
-    crop_top = int(round((image_height - crop_height) / 2.0))
-    crop_left = int(round((image_width - crop_width) / 2.0))
+    # A crop box reaching outside the image is zero padded by crop itself, so
+    # the oversized case is handled with a single copy instead of pad + crop.
+    if crop_height > image_height:
+        crop_top = -((crop_height - image_height) // 2)
+    else:
+        crop_top = int(round((image_height - crop_height) / 2.0))
+    if crop_width > image_width:
+        crop_left = -((crop_width - image_width) // 2)
+    else:
+        crop_left = int(round((image_width - crop_width) / 2.0))
     return crop(img, crop_top, crop_left, crop_height, crop_width)
 
 
@@ -619,9 +681,16 @@ def resized_crop(
     Returns:
         PIL Image or Tensor: Cropped image.
     """
-    img = crop(img, top, left, height, width)
-    img = resize(img, size, interpolation)
-    return img
+    interpolation = _check_interpolation(interpolation)
+
+    # dispatch once for both steps instead of going through crop and resize
+    if not isinstance(img, flow.Tensor):
+        pil_interpolation = interpolation.pil_value
+        img = F_pil.crop(img, top, left, height, width)
+        return F_pil.resize(img, size=size, interpolation=pil_interpolation)
+
+    img = F_t.crop(img, top, left, height, width)
+    return F_t.resize(img, size=size, interpolation=interpolation.value)
 
 
 def hflip(img: Tensor) -> Tensor:
@@ -689,24 +758,26 @@ def five_crop(
     if len(size) != 2:
         raise ValueError("Please provide only two dimensions (h, w) for size.")
 
-    image_width, image_height = _get_image_size(img)
+    # dispatch once instead of once per crop
+    backend = F_t if isinstance(img, flow.Tensor) else F_pil
+
+    image_width, image_height = backend._get_image_size(img)
     crop_height, crop_width = size
     if crop_width > image_width or crop_height > image_height:
         msg = "Requested crop size {} is bigger than input size {}"
         raise ValueError(msg.format(size, (image_height, image_width)))
 
-    tl = crop(img, 0, 0, crop_height, crop_width)
-    tr = crop(img, 0, image_width - crop_width, crop_height, crop_width)
-    bl = crop(img, image_height - crop_height, 0, crop_height, crop_width)
-    br = crop(
-        img,
-        image_height - crop_height,
-        image_width - crop_width,
-        crop_height,
-        crop_width,
-    )
+    bottom = image_height - crop_height
+    right = image_width - crop_width
+    tl = backend.crop(img, 0, 0, crop_height, crop_width)
+    tr = backend.crop(img, 0, right, crop_height, crop_width)
+    bl = backend.crop(img, bottom, 0, crop_height, crop_width)
+    br = backend.crop(img, bottom, right, crop_height, crop_width)
 
-    center = center_crop(img, [crop_height, crop_width])
+    # the crop fits, so center_crop would never pad here
+    center_top = int(round(bottom / 2.0))
+    center_left = int(round(right / 2.0))
+    center = backend.crop(img, center_top, center_left, crop_height, crop_width)
 
     return tl, tr, bl, br, center
 
@@ -744,10 +815,11 @@ def ten_crop(img: Tensor, size: List[int], vertical_flip: bool = False) -> List[
 
     first_five = five_crop(img, size)
 
+    backend = F_t if isinstance(img, flow.Tensor) else F_pil
     if vertical_flip:
-        img = vflip(img)
+        img = backend.vflip(img)
     else:
-        img = hflip(img)
+        img = backend.hflip(img)
 
     second_five = five_crop(img, size)
     return first_five + second_five
@@ -853,9 +925,23 @@ def _get_inverse_affine_matrix(
     translate: List[float],
     scale: float,
     shear: List[float],
-) -> List[float]:
-    # Helper method to compute inverse matrix for affine transformation
+) -> Tuple[float, ...]:
+    # Helper method to compute inverse matrix for affine transformation.
+    # Results are cached, so repeated parameters (e.g. fixed angles) skip the trig.
+    # The cached tuple is returned as is; being immutable, it is safe to share.
+    return _compute_inverse_affine_matrix(
+        tuple(center), float(angle), tuple(translate), float(scale), tuple(shear)
+    )
+
 
+@functools.lru_cache(maxsize=4096)
+def _compute_inverse_affine_matrix(
+    center: Tuple[float, float],
+    angle: float,
+    translate: Tuple[float, float],
+    scale: float,
+    shear: Tuple[float, float],
+) -> Tuple[float, ...]:
     # As it is explained in PIL.Image.rotate
     # We need compute INVERSE of affine transformation matrix: M = T * C * RSS * C^-1
     # where T is translation matrix: [1, 0, tx | 0, 1, ty | 0, 0, 1]
@@ -881,24 +967,24 @@ def _get_inverse_affine_matrix(
 
     # RSS without scaling
     a = math.cos(rot - sy) / math.cos(sy)
-    b = -math.cos(rot - sy) * math.tan(sx) / math.cos(sy) - math.sin(rot)
     c = math.sin(rot - sy) / math.cos(sy)
-    d = -math.sin(rot - sy) * math.tan(sx) / math.cos(sy) + math.cos(rot)
+    tan_sx = math.tan(sx)
+    b = -a * tan_sx - math.sin(rot)
+    d = -c * tan_sx + math.cos(rot)
 
     # Inverted rotation matrix with scale and shear
     # det([[a, b], [c, d]]) == 1, since det(rotation) = 1 and det(shear) = 1
-    matrix = [d, -b, 0.0, -c, a, 0.0]
-    matrix = [x / scale for x in matrix]
+    inv_scale = 1.0 / scale
+    matrix = [d * inv_scale, -b * inv_scale, 0.0, -c * inv_scale, a * inv_scale, 0.0]
 
     # Apply inverse of translation and of center translation: RSS^-1 * C^-1 * T^-1
-    matrix[2] += matrix[0] * (-cx - tx) + matrix[1] * (-cy - ty)
-    matrix[5] += matrix[3] * (-cx - tx) + matrix[4] * (-cy - ty)
-
-    # Apply center translation: C * RSS^-1 * C^-1 * T^-1
-    matrix[2] += cx
-    matrix[5] += cy
+    # followed by center translation: C * RSS^-1 * C^-1 * T^-1
+    nx = -(cx + tx)
+    ny = -(cy + ty)
+    matrix[2] = matrix[0] * nx + matrix[1] * ny + cx
+    matrix[5] = matrix[3] * nx + matrix[4] * ny + cy
 
-    return matrix
+    return tuple(matrix)
 
 
 def rotate(
@@ -943,13 +1029,7 @@ def rotate(
         )
         interpolation = _interpolation_modes_from_int(resample)
 
-    # Backward compatibility with integer value
-    if isinstance(interpolation, int):
-        warnings.warn(
-            "Argument interpolation should be of type InterpolationMode instead of int. "
-            "Please, use InterpolationMode enum."
-        )
-        interpolation = _interpolation_modes_from_int(interpolation)
+    interpolation = _check_interpolation(interpolation)
 
     if not isinstance(angle, (int, float)):
         raise TypeError("Argument angle should be int or float")
@@ -957,11 +1037,8 @@ def rotate(
     if center is not None and not isinstance(center, (list, tuple)):
         raise TypeError("Argument center should be a sequence")
 
-    if not isinstance(interpolation, InterpolationMode):
-        raise TypeError("Argument interpolation should be a InterpolationMode")
-
     if not isinstance(img, flow.Tensor):
-        pil_interpolation = pil_modes_mapping[interpolation]
+        pil_interpolation = interpolation.pil_value
         return F_pil.rotate(
             img,
             angle=angle,
@@ -971,6 +1048,30 @@ def rotate(
             fill=fill,
         )
 
+    # validate before the shortcuts below, so whether the interpolation mode and
+    # fill are accepted does not depend on the angle
+    F_t._assert_grid_transform_inputs(
+        img, None, interpolation.value, fill, ["nearest", "bilinear"]
+    )
+
+    if angle % 360 == 0:
+        # no rotation about any center, without or with expand
+        return img
+
+    if center is None and angle % 90 == 0:
+        # Quarter turns about the center map pixels onto pixels exactly, so they
+        # are done by transposing and flipping instead of resampling. Odd turns of
+        # a non-square image only qualify when the output is expanded to fit.
+        k = int(angle // 90) % 4
+        w, h = F_t._get_image_size(img)
+        if k % 2 == 0 or expand or w == h:
+            return F_t.rot90(img, k)
+
+    if isinstance(fill, (int, float)):
+        fill = [float(fill)]
+    elif fill is not None:
+        fill = [float(f) for f in fill]
+
     center_f = [0.0, 0.0]
     if center is not None:
         img_size = _get_image_size(img)
@@ -980,7 +1081,6 @@ def rotate(
     # due to current incoherence of rotation angle direction between affine and rotate implementations
     # we need to set -angle.
     matrix = _get_inverse_affine_matrix(center_f, -angle, [0.0, 0.0], 1.0, [0.0, 0.0])
-    raise NotImplementedError("Tensor rotate is not implemented yet!")
     return F_t.rotate(
         img, matrix=matrix, interpolation=interpolation.value, expand=expand, fill=fill
     )
@@ -989,7 +1089,8 @@ def rotate(
 def rgb_to_grayscale(img: Tensor, num_output_channels: int = 1) -> Tensor:
     """Convert RGB image to grayscale version of image.
     If the image is oneflow Tensor, it is expected
-    to have [..., 3, H, W] shape, where ... means an arbitrary number of leading dimensions
+    to have [..., 3, H, W] shape, where ... means an arbitrary number of leading dimensions.
+    Single channel tensors ([..., 1, H, W]) are treated as already grayscale.
 
     Note:
         Please, note that this method supports only RGB images as input. For inputs in other color spaces,
@@ -1053,38 +1154,42 @@ def gaussian_blur(
         raise ValueError(
             f"If kernel_size is a sequence its length should be 2. Got {len(kernel_size)}"
         )
-    for ksize in kernel_size:
-        if ksize % 2 == 0 or ksize < 0:
-            raise ValueError(
-                f"kernel_size should have odd and positive integers. Got {kernel_size}"
-            )
+    if any(ksize % 2 == 0 or ksize < 0 for ksize in kernel_size):
+        raise ValueError(
+            f"kernel_size should have odd and positive integers. Got {kernel_size}"
+        )
 
     if sigma is None:
         sigma = [ksize * 0.15 + 0.35 for ksize in kernel_size]
-
-    if sigma is not None and not isinstance(sigma, (int, float, list, tuple)):
+    elif isinstance(sigma, (int, float)):
+        sigma = [float(sigma), float(sigma)]
+    elif not isinstance(sigma, (list, tuple)):
         raise TypeError(
             f"sigma should be either float or sequence of floats. Got {type(sigma)}"
         )
-    if isinstance(sigma, (int, float)):
-        sigma = [float(sigma), float(sigma)]
-    if isinstance(sigma, (list, tuple)) and len(sigma) == 1:
+    elif len(sigma) == 1:
         sigma = [sigma[0], sigma[0]]
     if len(sigma) != 2:
         raise ValueError(
             f"If sigma is a sequence, its length should be 2. Got {len(sigma)}"
         )
-    for s in sigma:
-        if s <= 0.0:
-            raise ValueError(f"sigma should have positive values. Got {sigma}")
+    if any(s <= 0.0 for s in sigma):
+        raise ValueError(f"sigma should have positive values. Got {sigma}")
 
     t_img = img
     if not isinstance(img, flow.Tensor):
         if not F_pil._is_pil_image(img):
             raise TypeError(f"img should be PIL Image or Tensor. Got {type(img)}")
 
-        t_img = to_tensor(img)
+        # keep PIL pixels as uint8: F_t blurs in float and rounds back to the
+        # input dtype, so no [0, 1] rescaling is needed on either side.
+        # Binary images would come back as bool, so blur them as 0/255 "L".
+        if img.mode == "1":
+            img = img.convert("L")
+        t_img = pil_to_tensor(img)
 
+    # unit-stride rows keep the horizontal pass reading memory sequentially
+    t_img = t_img.contiguous()
     output = F_t.gaussian_blur(t_img, kernel_size, sigma)
 
     if not isinstance(img, flow.Tensor):
@@ -251,11 +251,9 @@ def to_grayscale(img: Image.Image, num_output_channels: int) -> Image.Image:
     if num_output_channels == 1:
         img = img.convert("L")
     elif num_output_channels == 3:
-        img = img.convert("L")
-        np_img = np.array(img, dtype=np.uint8)
-        np_img = np.dstack([np_img, np_img, np_img])
-        img = Image.fromarray(np_img, "RGB")
+        # replicate L into RGB natively instead of stacking three numpy copies
+        img = img.convert("L").convert("RGB")
     else:
         raise ValueError("num_output_channels should be either 1 or 3")
 
-    return
+    return img
@@ -1,11 +1,12 @@
 """
 """
+import functools
+import math
 import warnings
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Sequence
 
 from oneflow.framework.tensor import Tensor
 import oneflow as flow
-import oneflow.nn as nn
 from oneflow.nn.functional import grid_sample, conv2d, interpolate, pad as flow_pad
 
 
@@ -180,17 +181,29 @@ def rgb_to_grayscale(img: Tensor, num_output_channels: int = 1) -> Tensor:
                 img.ndim
             )
         )
-    _assert_channels(img, [3])
+    _assert_channels(img, [1, 3])
 
     if num_output_channels not in (1, 3):
         raise ValueError("num_output_channels should be either 1 or 3")
 
-    # TODO: replace split with unbind
-    r, g, b = img.split([1, 1, 1], -3)
+    if img.shape[-3] == 1:
+        # already grayscale, skip the weighted sum
+        if num_output_channels == 3:
+            return img.expand(*img.shape[:-3], 3, *img.shape[-2:])
+        return img
+
+    if img.dtype == flow.uint8:
+        # 16-bit fixed-point weights (0.299, 0.587, 0.114 scaled to sum to 2**16),
+        # accumulated in int32 and rounded, like PIL's own L conversion
+        r, g, b = img.to(flow.int32).split([1, 1, 1], -3)
+        l_img = ((19595 * r + 38470 * g + 7471 * b + 32768) // 65536).to(img.dtype)
+    else:
+        # TODO: replace split with unbind
+        r, g, b = img.split([1, 1, 1], -3)
 
-    # This implementation closely follows the TF one:
-    # https://github.com/tensorflow/tensorflow/blob/v2.3.0/tensorflow/python/ops/image_ops_impl.py#L2105-L2138
-    l_img = (0.2989 * r + 0.587 * g + 0.114 * b).to(img.dtype)
+        # This implementation closely follows the TF one:
+        # https://github.com/tensorflow/tensorflow/blob/v2.3.0/tensorflow/python/ops/image_ops_impl.py#L2105-L2138
+        l_img = (0.2989 * r + 0.587 * g + 0.114 * b).to(img.dtype)
     if num_output_channels == 3:
         return l_img.expand(*img.shape)
 
@@ -239,6 +252,10 @@ def adjust_hue(img: Tensor, hue_factor: float) -> Tensor:
     if _get_image_num_channels(img) == 1:  # Match PIL behaviour
         return img
 
+    if hue_factor == 0.0:
+        # a zero shift is the identity, skip the HSV round trip
+        return img
+
     orig_dtype = img.dtype
     if img.dtype == flow.uint8:
         img = img.to(dtype=flow.float32) / 255.0
@@ -500,7 +517,7 @@ def resize(img: Tensor, size: List[int], interpolation: str = "bilinear") -> Ten
 
 def _assert_grid_transform_inputs(
     img: Tensor,
-    matrix: Optional[List[float]],
+    matrix: Optional[Sequence[float]],
     interpolation: str,
     fill: Optional[List[float]],
     supported_interpolation_modes: List[str],
@@ -512,8 +529,8 @@ def _assert_grid_transform_inputs(
 
     _assert_image_tensor(img)
 
-    if matrix is not None and not isinstance(matrix, list):
-        raise TypeError("Argument matrix should be a list")
+    if matrix is not None and not isinstance(matrix, (list, tuple)):
+        raise TypeError("Argument matrix should be a list or tuple")
 
     if matrix is not None and len(matrix) != 6:
         raise ValueError("Argument matrix should have 6 float values")
@@ -543,28 +560,162 @@ def _assert_grid_transform_inputs(
         )
 
 
-def _get_gaussian_kernel1d(kernel_size: int, sigma: float) -> Tensor:
+def _apply_grid_transform(
+    img: Tensor, grid: Tensor, mode: str, fill: Optional[List[float]]
+) -> Tensor:
+    img, need_cast, need_squeeze, out_dtype = _cast_squeeze_in(img, [grid.dtype])
+
+    if img.shape[0] > 1:
+        # Apply same grid to a batch of images
+        grid = grid.expand(img.shape[0], grid.shape[1], grid.shape[2], grid.shape[3])
+
+    # Append a dummy mask for customized fill colors, should be faster than grid_sample() twice
+    if fill is not None:
+        dummy = flow.ones(
+            (img.shape[0], 1, img.shape[2], img.shape[3]),
+            dtype=img.dtype,
+            device=img.device,
+        )
+        img = flow.cat((img, dummy), dim=1)
+
+    img = grid_sample(img, grid, mode=mode, padding_mode="zeros", align_corners=False)
+
+    # Fill with required color
+    if fill is not None:
+        mask = img[:, -1:, :, :]  # N * 1 * H * W
+        img = img[:, :-1, :, :]  # N * C * H * W
+        mask = mask.expand_as(img)
+        len_fill = len(fill) if isinstance(fill, (tuple, list)) else 1
+        fill_img = (
+            flow.tensor(fill, dtype=img.dtype, device=img.device)
+            .view(1, len_fill, 1, 1)
+            .expand_as(img)
+        )
+        if mode == "nearest":
+            img = flow.where(mask < 0.5, fill_img, img)
+        else:  # 'bilinear'
+            img = img * mask + (1.0 - mask) * fill_img
+
+    img = _cast_squeeze_out(img, need_cast, need_squeeze, out_dtype)
+    return img
+
+
+def _gen_affine_grid(theta: Tensor, w: int, h: int, ow: int, oh: int) -> Tensor:
+    # https://github.com/pytorch/pytorch/blob/74b65c32be68b15dc7c9e8bb62459efbfbde33d8/aten/src/ATen/native/
+    # AffineGridGenerator.cpp#L18
+    # Difference with AffineGridGenerator is that:
+    # 1) we normalize grid values after applying theta
+    # 2) we can normalize by other image size, such that it covers "extend" option like in PIL.Image.rotate
+
+    d = 0.5
+    x_grid = flow.linspace(
+        -ow * 0.5 + d, ow * 0.5 + d - 1, steps=ow, dtype=theta.dtype
+    ).to(theta.device)
+    y_grid = flow.linspace(
+        -oh * 0.5 + d, oh * 0.5 + d - 1, steps=oh, dtype=theta.dtype
+    ).to(theta.device)
+    base_grid = flow.stack(
+        (
+            x_grid.view(1, ow).expand(oh, ow),
+            y_grid.view(oh, 1).expand(oh, ow),
+            flow.ones((oh, ow), dtype=theta.dtype, device=theta.device),
+        ),
+        dim=-1,
+    )
+
+    rescaled_theta = theta.transpose(1, 2) / flow.tensor(
+        [0.5 * w, 0.5 * h], dtype=theta.dtype, device=theta.device
+    )
+    output_grid = flow.bmm(base_grid.view(1, oh * ow, 3), rescaled_theta)
+    return output_grid.view(1, oh, ow, 2)
+
+
+def _compute_output_size(matrix: Sequence[float], w: int, h: int) -> Tuple[int, int]:
+    # Inspired of PIL implementation:
+    # https://github.com/python-pillow/Pillow/blob/11de3318867e4398057373ee9f12dcb33db7335c/src/PIL/Image.py#L2054
+
+    # pts are Top-Left, Top-Right, Bottom-Left, Bottom-Right points.
+    # Only four points are transformed, so this is done in plain Python.
+    pts = [
+        (-0.5 * w, -0.5 * h),
+        (-0.5 * w, 0.5 * h),
+        (0.5 * w, 0.5 * h),
+        (0.5 * w, -0.5 * h),
+    ]
+    xs = [matrix[0] * x + matrix[1] * y + matrix[2] for x, y in pts]
+    ys = [matrix[3] * x + matrix[4] * y + matrix[5] for x, y in pts]
+
+    # shift points to [0, w] and [0, h] interval to match PIL results
+    # and truncate precision to 1e-4 to avoid ceil of Xe-15 to 1.0
+    tol = 1e-4
+    size = []
+    for vals, shift in ((xs, w * 0.5), (ys, h * 0.5)):
+        cmax = math.ceil(math.trunc((max(vals) + shift) / tol) * tol)
+        cmin = math.floor(math.trunc((min(vals) + shift) / tol) * tol)
+        size.append(int(cmax - cmin))
+    return size[0], size[1]
+
+
+def rotate(
+    img: Tensor,
+    matrix: Sequence[float],
+    interpolation: str = "nearest",
+    expand: bool = False,
+    fill: Optional[List[float]] = None,
+) -> Tensor:
+    _assert_grid_transform_inputs(
+        img, matrix, interpolation, fill, ["nearest", "bilinear"]
+    )
+    w, h = img.shape[-1], img.shape[-2]
+    ow, oh = _compute_output_size(matrix, w, h) if expand else (w, h)
+    dtype = img.dtype if flow.is_floating_point(img) else flow.float32
+    theta = flow.tensor(matrix, dtype=dtype, device=img.device).reshape(1, 2, 3)
+    # grid will be generated on the same device as theta and img
+    grid = _gen_affine_grid(theta, w=w, h=h, ow=ow, oh=oh)
+    return _apply_grid_transform(img, grid, interpolation, fill=fill)
+
+
+def rot90(img: Tensor, k: int) -> Tensor:
+    # Exact counter-clockwise quarter turns about the image center,
+    # done with a transpose and a flip instead of resampling.
+    _assert_image_tensor(img)
+    k = k % 4
+    if k == 1:
+        return img.transpose(-2, -1).flip(-2)
+    if k == 2:
+        return img.flip([-2, -1])
+    if k == 3:
+        return img.transpose(-2, -1).flip(-1)
+    return img
+
+
+@functools.lru_cache(maxsize=256)
+def _get_gaussian_kernel1d(
+    kernel_size: int, sigma: float, dtype: flow.dtype, device: str
+) -> Tensor:
+    # NOTE: cached kernels are shared between calls and must not be modified in place
     ksize_half = (kernel_size - 1) * 0.5
 
     x = flow.linspace(-ksize_half, ksize_half, steps=kernel_size)
     pdf = flow.exp(-0.5 * (x / sigma).pow(2))
     kernel1d = pdf / pdf.sum()
 
-    return kernel1d
+    return kernel1d.to(device, dtype=dtype)
 
 
-def _get_gaussian_kernel2d(
-    kernel_size: List[int], sigma: List[float], dtype: flow.dtype, device: flow.device
-) -> Tensor:
-    kernel1d_x = _get_gaussian_kernel1d(kernel_size[0], sigma[0]).to(
-        device, dtype=dtype
-    )
-    kernel1d_y = _get_gaussian_kernel1d(kernel_size[1], sigma[1]).to(
-        device, dtype=dtype
+def _depthwise_conv2d(img: Tensor, kernel: Tensor) -> Tensor:
+    # call the functional op directly: building an nn.Conv2d per pass would also
+    # run its random weight init, consuming the global RNG on every blur
+    return conv2d(
+        img,
+        weight=kernel,
+        bias=None,
+        stride=1,
+        padding=0,
+        dilation=1,
+        groups=img.shape[-3],
+        channel_pos="channels_first",
     )
-    kernel2d = flow.matmul(kernel1d_y[:, None], kernel1d_x[None, :])
-
-    return kernel2d
 
 
 def gaussian_blur(img: Tensor, kernel_size: List[int], sigma: List[float]) -> Tensor:
@@ -574,10 +725,20 @@ def gaussian_blur(img: Tensor, kernel_size: List[int], sigma: List[float]) -> Te
     _assert_image_tensor(img)
 
     dtype = img.dtype if flow.is_floating_point(img) else flow.float32
-    kernel = _get_gaussian_kernel2d(kernel_size, sigma, dtype=dtype, device=img.device)
-    kernel = kernel.expand(img.shape[-3], 1, kernel.shape[0], kernel.shape[1])
-
-    img, need_cast, need_squeeze, out_dtype = _cast_squeeze_in(img, [kernel.dtype,],)
+    if dtype in (flow.float16, flow.bfloat16) and img.device.type != "cuda":
+        # half precision input is blurred natively on GPU (the kernel is cast to
+        # match), but CPU convolutions have no fast half kernels, so use float32
+        dtype = flow.float32
+    num_channels = img.shape[-3]
+    # The gaussian kernel is the outer product of two 1-D kernels, so the blur is
+    # done as a horizontal then a vertical pass: kx + ky taps per pixel, not kx * ky.
+    device = str(img.device)
+    kernel_x = _get_gaussian_kernel1d(kernel_size[0], float(sigma[0]), dtype, device)
+    kernel_y = _get_gaussian_kernel1d(kernel_size[1], float(sigma[1]), dtype, device)
+    kernel_x = kernel_x.view(1, 1, 1, -1).repeat(num_channels, 1, 1, 1)
+    kernel_y = kernel_y.view(1, 1, -1, 1).repeat(num_channels, 1, 1, 1)
+
+    img, need_cast, need_squeeze, out_dtype = _cast_squeeze_in(img, [dtype,],)
 
     # padding = (left, right, top, bottom)
     padding = [
@@ -587,20 +748,8 @@ def gaussian_blur(img: Tensor, kernel_size: List[int], sigma: List[float]) -> Te
         kernel_size[1] // 2,
     ]
     img = flow_pad(img, padding, mode="reflect")
-
-    # TODO: fix the bug of oneflow.nn.functional.conv2d
-    # img = conv2d(img, kernel, groups=img.shape[-3], stride=[1], padding=[0], dilation=[1])
-
-    # the alternative
-    Conv2d = nn.Conv2d(
-        in_channels=img.shape[-3],
-        out_channels=img.shape[-3],
-        kernel_size=kernel.size()[2:],
-        groups=img.shape[-3],
-        bias=False,
-    )
-    Conv2d.weight = nn.Parameter(kernel)
-    img = Conv2d(img)
+    img = _depthwise_conv2d(img, kernel_x)
+    img = _depthwise_conv2d(img, kernel_y)
 
     img = _cast_squeeze_out(img, need_cast, need_squeeze, out_dtype)
     return img
@@ -0,0 +1,106 @@
+import unittest
+import numpy as np
+
+import oneflow as flow
+import oneflow.nn as nn
+from flowvision.models.densenet import DenseNet, cp
+
+
+def _tiny_densenet(**kwargs):
+    flow.manual_seed(0)
+    model = DenseNet(
+        growth_rate=4,
+        block_config=(2, 2),
+        num_init_features=8,
+        num_classes=10,
+        **kwargs
+    )
+    # non-trivial BatchNorm statistics, so folding them is actually exercised
+    for m in model.modules():
+        if isinstance(m, nn.BatchNorm2d):
+            nn.init.uniform_(m.weight, 0.5, 1.5)
+            nn.init.uniform_(m.bias, -0.5, 0.5)
+            nn.init.uniform_(m.running_mean, -0.5, 0.5)
+            nn.init.uniform_(m.running_var, 0.5, 1.5)
+    return model.eval()
+
+
+def _test_no_grad_matches_grad(self):
+    model = _tiny_densenet()
+    x = flow.randn(2, 3, 32, 32)
+    y_grad = model(x).detach().numpy()
+    # without autograd the dense blocks write into one shared buffer
+    with flow.no_grad():
+        y_no_grad = model(x).numpy()
+    self.assertTrue(np.allclose(y_grad, y_no_grad, rtol=1e-5, atol=1e-5))
+
+
+def _test_fuse_for_inference(self, device):
+    model = _tiny_densenet().to(device)
+    # batch size 1 would be garbage if any fused module normalized with batch stats
+    for x in [flow.randn(2, 3, 32, 32), flow.randn(1, 3, 32, 32)]:
+        x = x.to(device)
+        with flow.no_grad():
+            y_ref = model(x).cpu().numpy()
+        fused = _tiny_densenet().to(device).fuse_for_inference()
+        # norm5 and the head ReLU are only merged on CUDA
+        self.assertEqual(fused.norm5_relu_fused, device == "cuda")
+        self.assertTrue(all(not m.training for m in fused.modules()))
+        with flow.no_grad():
+            y_fused = fused(x).cpu().numpy()
+        self.assertTrue(np.allclose(y_ref, y_fused, rtol=1e-4, atol=1e-4))
+
+        # fusing twice is a no-op
+        with flow.no_grad():
+            y_refused = fused.fuse_for_inference()(x).cpu().numpy()
+        self.assertTrue(np.array_equal(y_fused, y_refused))
+
+
+def _test_fuse_for_inference_half(self):
+    model = _tiny_densenet().half()
+    model.fuse_for_inference()
+    # the rebuilt convolutions keep the model's dtype instead of reverting to float32
+    for name, param in model.named_parameters():
+        self.assertEqual(param.dtype, flow.float16, name)
+
+
+def _test_memory_efficient(self):
+    x = flow.randn(2, 3, 32, 32)
+    outputs, grads = [], []
+    for memory_efficient in [False, True]:
+        model = _tiny_densenet(memory_efficient=memory_efficient).train()
+        y = model(x)
+        y.sum().backward()
+        outputs.append(y.detach().numpy())
+        grads.append({n: p.grad.numpy() for n, p in model.named_parameters()})
+
+    # checkpointing recomputes the bottleneck in backward, results must not change
+    self.assertTrue(np.allclose(outputs[0], outputs[1], rtol=1e-5, atol=1e-5))
+    self.assertEqual(grads[0].keys(), grads[1].keys())
+    for name in grads[0]:
+        self.assertTrue(
+            np.allclose(grads[0][name], grads[1][name], rtol=1e-4, atol=1e-5), name
+        )
+
+
+class TestDenseNet(unittest.TestCase):
+    def test_no_grad_matches_grad(self):
+        _test_no_grad_matches_grad(self)
+
+    def test_fuse_for_inference(self):
+        _test_fuse_for_inference(self, "cpu")
+
+    @unittest.skipUnless(flow.cuda.is_available(), "norm5 is only fused on CUDA")
+    def test_fuse_for_inference_cuda(self):
+        _test_fuse_for_inference(self, "cuda")
+
+    def test_fuse_for_inference_half(self):
+        _test_fuse_for_inference_half(self)
+
+    @unittest.skipUnless(cp is not None, "oneflow.utils.checkpoint is not available")
+    def test_memory_efficient(self):
+        _test_memory_efficient(self)
+
+
+if __name__ == "__main__":
+    unittest.main()
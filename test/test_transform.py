@@ -141,6 +141,194 @@ def _test_adjust_hue(self):
     self.assertTrue(np.allclose(y_np, y_ans))
 
 
+def _test_rotate(self):
+    x_np = np.arange(4 * 6 * 3, dtype=np.uint8).reshape(4, 6, 3)
+    x_pil = Image.fromarray(x_np, mode="RGB")
+    x_tensor = F.pil_to_tensor(x_pil)
+
+    # quarter turns are exact, so tensor and PIL results must agree
+    for angle in [0, 90, 180, 270, -90]:
+        y_pil = F.rotate(x_pil, angle, expand=True)
+        y_tensor = F.rotate(x_tensor, angle, expand=True)
+        y_np = np.transpose(y_tensor.numpy(), (1, 2, 0))
+        self.assertTrue(np.array_equal(y_np, np.array(y_pil)))
+
+    # general angles resample, only check that expand matches PIL's output size
+    y_pil = F.rotate(x_pil, 30, expand=True)
+    y_tensor = F.rotate(x_tensor, 30, F.InterpolationMode.BILINEAR, expand=True)
+    self.assertEqual(list(y_tensor.shape[-2:]), [y_pil.size[1], y_pil.size[0]])
+
+    # an explicit center skips the quarter turn shortcut and resamples with
+    # grid_sample; on a square image pixel centers still map onto pixel centers
+    x_np = np.arange(6 * 6 * 3, dtype=np.uint8).reshape(6, 6, 3)
+    x_pil = Image.fromarray(x_np, mode="RGB")
+    x_tensor = F.pil_to_tensor(x_pil)
+    for angle in [90, 180, 270]:
+        y_pil = F.rotate(x_pil, angle, center=[3, 3])
+        y_tensor = F.rotate(x_tensor, angle, center=[3, 3])
+        y_np = np.transpose(y_tensor.numpy(), (1, 2, 0))
+        self.assertTrue(np.array_equal(y_np, np.array(y_pil)))
+        self.assertTrue(
+            np.array_equal(y_tensor.numpy(), F_t.rot90(x_tensor, angle // 90).numpy())
+        )
+
+    # invalid arguments are rejected whether or not a quarter turn shortcut applies
+    for angle in [0, 90, 91]:
+        with self.assertRaises(ValueError):
+            F.rotate(x_tensor, angle, F.InterpolationMode.BICUBIC)
+        with self.assertRaises(ValueError):
+            F.rotate(x_tensor, angle, fill=[0, 0])
+
+    # corners rotated by 45 degrees sample outside the image and take the fill
+    fill = [255, 0, 0]
+    y_pil = np.array(F.rotate(x_pil, 45, fill=fill))
+    y_np = np.transpose(F.rotate(x_tensor, 45, fill=fill).numpy(), (1, 2, 0))
+    for i, j in [(0, 0), (0, -1), (-1, 0), (-1, -1)]:
+        self.assertEqual(y_pil[i, j].tolist(), fill)
+        self.assertEqual(y_np[i, j].tolist(), fill)
+
+
+def _test_rgb_to_grayscale_uint8(self):
+    x_np = np.random.randint(0, 256, size=(17, 19, 3)).astype(np.uint8)
+    x_pil = Image.fromarray(x_np, mode="RGB")
+    x_tensor = F.pil_to_tensor(x_pil)
+
+    # the fixed-point luma weights reproduce PIL's L conversion exactly
+    y_tensor = F.rgb_to_grayscale(x_tensor)
+    self.assertEqual(y_tensor.dtype, flow.uint8)
+    self.assertTrue(np.array_equal(y_tensor.numpy()[0], np.array(x_pil.convert("L"))))
+
+
+def _test_rgb_to_grayscale_single_channel(self):
+    x = flow.tensor(np.random.randint(0, 256, size=(2, 1, 5, 6)).astype(np.uint8))
+
+    # already grayscale input is returned without recomputing the luma
+    y = F.rgb_to_grayscale(x, num_output_channels=1)
+    self.assertTrue(np.array_equal(y.numpy(), x.numpy()))
+
+    y = F.rgb_to_grayscale(x, num_output_channels=3)
+    self.assertEqual(list(y.shape), [2, 3, 5, 6])
+    self.assertTrue(np.array_equal(y.numpy(), np.repeat(x.numpy(), 3, axis=1)))
+
+
+def _test_rgb_to_grayscale_pil(self):
+    x_np = np.random.randint(0, 256, size=(7, 9, 3)).astype(np.uint8)
+    x_pil = Image.fromarray(x_np, mode="RGB")
+    gray = np.array(x_pil.convert("L"))
+
+    y_pil = F.rgb_to_grayscale(x_pil, num_output_channels=1)
+    self.assertEqual(y_pil.mode, "L")
+    self.assertTrue(np.array_equal(np.array(y_pil), gray))
+
+    y_pil = F.rgb_to_grayscale(x_pil, num_output_channels=3)
+    self.assertEqual(y_pil.mode, "RGB")
+    self.assertTrue(np.array_equal(np.array(y_pil), np.stack([gray] * 3, axis=-1)))
+
+
+def _center_crop_reference(x_np, crop_height, crop_width):
+    # the previous implementation: zero pad up to the crop size, then crop
+    _, h, w = x_np.shape
+    pad_h, pad_w = max(crop_height - h, 0), max(crop_width - w, 0)
+    x_np = np.pad(
+        x_np,
+        ((0, 0), (pad_h // 2, (pad_h + 1) // 2), (pad_w // 2, (pad_w + 1) // 2)),
+        mode="constant",
+    )
+    _, h, w = x_np.shape
+    top = int(round((h - crop_height) / 2.0))
+    left = int(round((w - crop_width) / 2.0))
+    return x_np[:, top : top + crop_height, left : left + crop_width]
+
+
+def _test_center_crop(self):
+    x_np = np.random.randint(1, 256, size=(3, 5, 6)).astype(np.uint8)
+    x_tensor = flow.tensor(x_np)
+    x_pil = Image.fromarray(np.transpose(x_np, (1, 2, 0)), mode="RGB")
+    # odd and even size differences, one or both dimensions oversized, or none
+    for output_size in [(7, 8), (8, 9), (7, 4), (3, 9), (8, 6), (5, 6), (4, 3)]:
+        y_ans = _center_crop_reference(x_np, *output_size)
+
+        y_tensor = F.center_crop(x_tensor, list(output_size))
+        self.assertTrue(np.array_equal(y_tensor.numpy(), y_ans), output_size)
+
+        y_pil = np.transpose(
+            np.array(F.center_crop(x_pil, list(output_size))), (2, 0, 1)
+        )
+        self.assertTrue(np.array_equal(y_pil, y_ans), output_size)
+
+
+def _test_normalize(self):
+    x_np = np.random.rand(2, 3, 5, 6).astype(np.float32)
+    mean, std = [0.485, 0.456, 0.406], [0.229, 0.224, 0.225]
+    y_ans = (x_np - np.reshape(mean, (3, 1, 1))) / np.reshape(std, (3, 1, 1))
+    cases = [
+        (mean, std, y_ans),
+        (0.5, 0.25, (x_np - 0.5) / 0.25),
+        (flow.tensor(mean), flow.tensor(std), y_ans),
+    ]
+    for m, s, ans in cases:
+        # the second round reuses the cached mean/std tensors
+        for _ in range(2):
+            x = flow.tensor(x_np)
+            y = F.normalize(x, m, s)
+            self.assertTrue(np.allclose(y.numpy(), ans, atol=1e-5))
+            self.assertTrue(np.array_equal(x.numpy(), x_np))
+
+            y = F.normalize(x, m, s, inplace=True)
+            self.assertTrue(np.allclose(y.numpy(), ans, atol=1e-5))
+            self.assertTrue(np.allclose(x.numpy(), ans, atol=1e-5))
+
+    # a single (C, H, W) image
+    y = F.normalize(flow.tensor(x_np[0]), mean, std)
+    self.assertTrue(np.allclose(y.numpy(), y_ans[0], atol=1e-5))
+
+
+def _gaussian_blur_reference(x_np, kernel_size, sigma):
+    # direct 2-D correlation with the outer product kernel on a (C, H, W) array
+    kernels = []
+    for ksize, s in zip(kernel_size, sigma):
+        t = np.linspace(-(ksize - 1) * 0.5, (ksize - 1) * 0.5, ksize)
+        pdf = np.exp(-0.5 * (t / s) ** 2)
+        kernels.append(pdf / pdf.sum())
+    kernel2d = np.outer(kernels[1], kernels[0])
+    kx, ky = kernel_size
+    padded = np.pad(
+        x_np.astype(np.float64),
+        ((0, 0), (ky // 2, ky // 2), (kx // 2, kx // 2)),
+        mode="reflect",
+    )
+    h, w = x_np.shape[-2:]
+    out = np.zeros(x_np.shape, dtype=np.float64)
+    for i in range(ky):
+        for j in range(kx):
+            out += kernel2d[i, j] * padded[:, i : i + h, j : j + w]
+    return out
+
+
+def _test_gaussian_blur(self):
+    kernel_size, sigma = [3, 5], [0.8, 1.5]
+    x_np = np.random.randint(0, 256, size=(3, 10, 12)).astype(np.uint8)
+    y_ref = _gaussian_blur_reference(x_np, kernel_size, sigma)
+
+    # the separable passes must match the 2-D kernel
+    x_float = flow.tensor(x_np.astype(np.float32) / 255.0)
+    y_float = F.gaussian_blur(x_float, kernel_size, sigma).numpy()
+    self.assertTrue(np.allclose(y_float, y_ref / 255.0, atol=1e-5))
+
+    # integer input is blurred in float and rounded back
+    y_uint8 = F.gaussian_blur(flow.tensor(x_np), kernel_size, sigma)
+    self.assertEqual(y_uint8.dtype, flow.uint8)
+    self.assertTrue(
+        np.abs(y_uint8.numpy().astype(np.float64) - y_ref).max() <= 0.5 + 1e-3
+    )
+
+    x_pil = Image.fromarray(np.transpose(x_np, (1, 2, 0)), mode="RGB")
+    y_pil = np.transpose(
+        np.array(F.gaussian_blur(x_pil, kernel_size, sigma)), (2, 0, 1)
+    )
+    self.assertTrue(np.abs(y_pil.astype(np.float64) - y_ref).max() <= 0.5 + 1e-3)
+
+
 def _test_randomness(fn, trans, seed, p):
     flow.manual_seed(seed)
     img = transforms.ToPILImage()(flow.rand(3, 16, 18))
@@ -172,6 +360,23 @@ class TestTransform(unittest.TestCase):
         _test_adjust_saturation(self)
         _test_adjust_hue(self)
 
+    def test_rotate(self):
+        _test_rotate(self)
+
+    def test_rgb_to_grayscale(self):
+        _test_rgb_to_grayscale_uint8(self)
+        _test_rgb_to_grayscale_single_channel(self)
+        _test_rgb_to_grayscale_pil(self)
+
+    def test_center_crop(self):
+        _test_center_crop(self)
+
+    def test_normalize(self):
+        _test_normalize(self)
+
+    def test_gaussian_blur(self):
+        _test_gaussian_blur(self)
+
 
 if __name__ == "__main__":
     unittest.main()